@@ -0,0 +1,25 @@
+import importlib.util
+import os
+import sys
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Até este número de entregas a Força Bruta ainda é viável
+LIMITE_FORCA_BRUTA = 7
+
+
+def carregar_script(nome_arquivo):
+    """
+    Carrega outro script do projeto como módulo. Os nomes dos arquivos têm
+    hífens e não podem ser importados diretamente; o módulo é registrado em
+    `sys.modules` para que suas funções possam ser enviadas a outros processos.
+    """
+    nome_modulo = nome_arquivo[:-3].replace("-", "_")
+    if nome_modulo not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            nome_modulo, os.path.join(DIRETORIO, nome_arquivo)
+        )
+        modulo = importlib.util.module_from_spec(spec)
+        sys.modules[nome_modulo] = modulo
+        spec.loader.exec_module(modulo)
+    return sys.modules[nome_modulo]
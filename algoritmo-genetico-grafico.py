@@ -1,5 +1,9 @@
+import contextlib
+import gc
+import io
 import random
 import time
+import tracemalloc
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -128,7 +132,181 @@ def algoritmo_genetico_tsp(
     return melhor_rota_global, menor_custo_global, historico_custos
 
 
-# --- MÓDULO 4: Funções de Plotagem (ADICIONADO) ---
+# --- MÓDULO 4: Algoritmo Genético Estacionário (Buffers Pré-Alocados) ---
+
+
+def montar_matriz_distancias(distancias, num_cidades):
+    """
+    Converte o dicionário de distâncias em uma lista de listas indexada pelas
+    cidades (1 a N), para consultar custos sem criar tuplas a cada aresta.
+    """
+    matriz = [[float("inf")] * (num_cidades + 1) for _ in range(num_cidades + 1)]
+    for (i, j), peso in distancias.items():
+        matriz[i][j] = peso
+    return matriz
+
+
+def calcular_custo_rota_matriz(rota, matriz):
+    """Calcula o custo de uma rota cíclica consultando a matriz de distâncias."""
+    soma = matriz[rota[-1]][rota[0]]
+    for i in range(len(rota) - 1):
+        soma += matriz[rota[i]][rota[i + 1]]
+    return soma
+
+
+def selecao_por_torneio_indice(aptidoes, k=3):
+    """Torneio que retorna o índice do vencedor, sem montar a lista de competidores."""
+    vencedor = random.randrange(len(aptidoes))
+    for _ in range(k - 1):
+        competidor = random.randrange(len(aptidoes))
+        if aptidoes[competidor] < aptidoes[vencedor]:
+            vencedor = competidor
+    return vencedor
+
+
+def crossover_ciclico_em(pai1, pai2, filho, posicoes, visitados):
+    """
+    Cycle Crossover (CX) escrito diretamente no buffer `filho`. `posicoes`
+    (cidade -> índice em pai1) e `visitados` são buffers reaproveitados.
+    """
+    n = len(pai1)
+    for i in range(n):
+        posicoes[pai1[i]] = i
+        visitados[i] = False
+
+    indice_atual = 0
+    while not visitados[indice_atual]:
+        filho[indice_atual] = pai1[indice_atual]
+        visitados[indice_atual] = True
+        indice_atual = posicoes[pai2[indice_atual]]
+
+    for i in range(n):
+        if not visitados[i]:
+            filho[i] = pai2[i]
+
+
+def mutacao_por_inversao_em(rota, taxa_mutacao):
+    """Mutação por inversão feita com trocas na própria rota, sem copiar o segmento."""
+    if random.random() < taxa_mutacao:
+        inicio = random.randrange(len(rota))
+        fim = random.randrange(len(rota) - 1)
+        if fim >= inicio:
+            fim += 1
+        else:
+            inicio, fim = fim, inicio
+        while inicio < fim:
+            rota[inicio], rota[fim] = rota[fim], rota[inicio]
+            inicio += 1
+            fim -= 1
+
+
+def algoritmo_genetico_tsp_estacionario(
+    distancias,
+    num_cidades,
+    tam_pop=100,
+    max_geracoes=500,
+    taxa_mutacao=0.02,
+    tam_torneio=3,
+):
+    """
+    AG estacionário (steady-state) para o TSP. A população e os buffers de
+    trabalho são alocados uma única vez: cada filho é escrito em um buffer
+    reaproveitado e, se for melhor que o pior indivíduo, troca de lugar com
+    ele. Cada "geração" produz tam_pop - 1 filhos, como no AG geracional
+    com elitismo, e o melhor indivíduo nunca é substituído.
+    """
+    matriz = montar_matriz_distancias(distancias, num_cidades)
+    populacao = [gerar_rota_aleatoria_tsp(num_cidades) for _ in range(tam_pop)]
+    aptidoes = [calcular_custo_rota_matriz(rota, matriz) for rota in populacao]
+
+    filho = [0] * num_cidades
+    posicoes = [0] * (num_cidades + 1)
+    visitados = [False] * num_cidades
+    melhor_rota_global = [0] * num_cidades
+    menor_custo_global = float("inf")
+    historico_custos = []
+
+    print("\nIniciando o processo evolutivo (modo estacionário)...")
+    for geracao in range(max_geracoes):
+        menor_custo_geracao = min(aptidoes)
+        if menor_custo_geracao < menor_custo_global:
+            menor_custo_global = menor_custo_geracao
+            melhor_rota_global[:] = populacao[aptidoes.index(menor_custo_geracao)]
+            print(
+                f"Geração {geracao + 1:03d}: Nova melhor rota! Custo: {menor_custo_global}"
+            )
+        historico_custos.append(menor_custo_global)
+
+        for _ in range(tam_pop - 1):
+            pai1 = populacao[selecao_por_torneio_indice(aptidoes, tam_torneio)]
+            pai2 = populacao[selecao_por_torneio_indice(aptidoes, tam_torneio)]
+            crossover_ciclico_em(pai1, pai2, filho, posicoes, visitados)
+            mutacao_por_inversao_em(filho, taxa_mutacao)
+            custo_filho = calcular_custo_rota_matriz(filho, matriz)
+
+            pior = aptidoes.index(max(aptidoes))
+            if custo_filho < aptidoes[pior]:
+                # Troca os buffers: o filho entra na população e o pior
+                # indivíduo vira o buffer do próximo filho
+                populacao[pior], filho = filho, populacao[pior]
+                aptidoes[pior] = custo_filho
+
+    menor_custo_final = min(aptidoes)
+    if menor_custo_final < menor_custo_global:
+        menor_custo_global = menor_custo_final
+        melhor_rota_global[:] = populacao[aptidoes.index(menor_custo_final)]
+
+    print("\nProcesso evolutivo concluído.")
+    return melhor_rota_global, menor_custo_global, historico_custos
+
+
+def comparar_modos(distancias, num_cidades, tam_pop=100, max_geracoes=500, tam_torneio=5):
+    """
+    Compara o AG geracional com o estacionário: gerações por segundo, pico
+    de memória alocada durante a evolução (tracemalloc) e alocações por
+    geração. O Python não expõe um contador de alocações; com o limiar da
+    geração 0 do coletor de lixo em 1, cada coleta corresponde a poucos
+    contêineres novos (listas, tuplas) ainda vivos, então as coletas por
+    geração servem de medida das alocações de cada geração.
+    """
+    print(f"\n{'Modo':>14} {'ger/s':>9} {'pico (KiB)':>11} {'coletas/ger':>12} {'custo':>8}")
+    for nome, funcao in (
+        ("geracional", algoritmo_genetico_tsp),
+        ("estacionario", algoritmo_genetico_tsp_estacionario),
+    ):
+        # Primeira execução: só o tempo, sem instrumentação
+        tempo_inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, custo, _ = funcao(
+                distancias, num_cidades, tam_pop, max_geracoes, tam_torneio=tam_torneio
+            )
+        tempo = time.perf_counter() - tempo_inicio
+
+        # Segunda execução: pico de memória alocada durante a evolução
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            funcao(distancias, num_cidades, tam_pop, max_geracoes, tam_torneio=tam_torneio)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Terceira execução: coletas da geração 0 com limiar 1
+        limiares = gc.get_threshold()
+        coletas_inicio = gc.get_stats()[0]["collections"]
+        gc.set_threshold(1, *limiares[1:])
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                funcao(distancias, num_cidades, tam_pop, max_geracoes, tam_torneio=tam_torneio)
+        finally:
+            gc.set_threshold(*limiares)
+        coletas = gc.get_stats()[0]["collections"] - coletas_inicio
+
+        print(
+            f"{nome:>14} {max_geracoes / tempo:>9.1f} {pico / 1024:>11.1f} "
+            f"{coletas / max_geracoes:>12.1f} {custo:>8}"
+        )
+
+
+# --- MÓDULO 5: Funções de Plotagem (ADICIONADO) ---
 
 
 def plotar_caminho_tsp(caminho, custo, coordenadas_cidades):
@@ -212,11 +390,19 @@ if __name__ == "__main__":
         MAX_GERACOES = 5000
         TAXA_MUTACAO = 0.02
         TAM_TORNEIO = 5
+        # Modo estacionário: população em buffers pré-alocados, substituindo
+        # os piores indivíduos no lugar em vez de criar uma nova população
+        MODO_ESTACIONARIO = False
+        COMPARAR_MODOS = False  # Mede gerações/s e coletas do GC dos dois modos
 
         # MODIFICADO: Inicia o cronômetro aqui
         tempo_inicio_algoritmo = time.time()
 
-        rota, custo, historico = algoritmo_genetico_tsp(
+        if MODO_ESTACIONARIO:
+            funcao_ag = algoritmo_genetico_tsp_estacionario
+        else:
+            funcao_ag = algoritmo_genetico_tsp
+        rota, custo, historico = funcao_ag(
             distancias,
             NUM_CIDADES,
             TAM_POPULACAO,
@@ -243,6 +429,9 @@ if __name__ == "__main__":
         else:
             print("Não foi possível encontrar uma rota.")
 
+        if COMPARAR_MODOS:
+            comparar_modos(distancias, NUM_CIDADES, TAM_POPULACAO, 500, TAM_TORNEIO)
+
     # ADICIONADO: Imprime o tempo de execução total, incluindo plotagem
     tempo_fim_total = time.time()
     print(
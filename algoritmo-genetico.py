@@ -1,31 +1,59 @@
+import itertools
 import random
 import time
 
 # --- MÓDULO 1: Funções Auxiliares e de Leitura (Base do Projeto) ---
 
-def ler_matriz(arquivo):
+def ler_pontos_linhas(linhas):
     """
-    Lê o arquivo de texto, encontra os pontos e retorna um dicionário
-    com seus rótulos e coordenadas.
+    Lê os pontos a partir de um iterável de linhas (arquivo aberto, lista de
+    strings...), uma linha por vez, sem guardar a grade inteira na memória.
+
+    Aceita dois formatos:
+      - Grade: células separadas por espaço, com '0' nas vazias. Os rótulos
+        podem ter vários caracteres (ex: "P12"), desde que não sejam números.
+        Uma primeira linha com as dimensões (ex: "4 5") é ignorada.
+      - Esparso: primeira linha "esparso", seguida de "rotulo linha coluna"
+        para cada ponto.
     """
     pontos = {}
+    linhas = iter(linhas)
+    primeira = next(linhas, '')
+    tokens = primeira.split()
+
+    # Formato esparso: um ponto por linha
+    if len(tokens) == 1 and tokens[0].lower() == 'esparso':
+        for linha in linhas:
+            tokens = linha.split()
+            if tokens:
+                rotulo, i, j = tokens
+                pontos[rotulo] = {'linha': int(i), 'coluna': int(j)}
+        return pontos
+
+    # Se a primeira linha não for a dimensão da grade, ela já faz parte da grade
+    if not (len(tokens) == 2 and tokens[0].isdigit() and tokens[1].isdigit()):
+        linhas = itertools.chain([primeira], linhas)
+
+    for i, linha in enumerate(linhas):
+        # Linhas só com zeros (a maioria em grades grandes) nem são divididas
+        if not linha.strip(' 0\t\r\n'):
+            continue
+        for j, celula in enumerate(linha.split()):
+            if celula[0].isalpha():  # Rótulos começam com letra (R, A, P12...)
+                pontos[celula] = {'linha': i, 'coluna': j}
+    return pontos
+
+def ler_matriz(arquivo):
+    """
+    Lê o arquivo de texto (grade ou formato esparso), encontra os pontos e
+    retorna um dicionário com seus rótulos e coordenadas.
+    """
     try:
         with open(arquivo) as f:
-            matriz = f.readlines()
-            # Tenta pular a primeira linha se ela contiver as dimensões
-            try:
-                int(matriz[0].strip().split()[0])
-                matriz = matriz[1:]
-            except (ValueError, IndexError):
-                pass
-            for i, linha in enumerate(matriz):
-                for j, char in enumerate(linha.strip().split()):
-                    if char.isalpha():
-                        pontos[char] = {'linha': i, 'coluna': j}
+            return ler_pontos_linhas(f)
     except FileNotFoundError:
         print(f"Erro: O arquivo '{arquivo}' não foi encontrado.")
         return None
-    return pontos
 
 def calcular_custo_rota(rota, pontos, inicio='R'):
     """Calcula o custo total (Distância de Manhattan) de uma rota."""
@@ -109,14 +137,18 @@ def mutacao_por_inversao(rota, taxa_mutacao):
 
 # --- MÓDULO 3: O Algoritmo Genético Principal ---
 
-def algoritmo_genetico(pontos, tam_pop=100, max_geracoes=500, taxa_mutacao=0.02, tam_torneio=3, elitismo=True):
+def algoritmo_genetico(pontos, tam_pop=100, max_geracoes=500, taxa_mutacao=0.02, tam_torneio=3, elitismo=True, populacao_inicial=None):
     """
     Executa o Algoritmo Genético para resolver o problema do Caixeiro Viajante.
+    Se `populacao_inicial` for informada, a evolução parte dessas rotas
+    (completando com rotas aleatórias) em vez de uma população do zero.
     """
     inicio = 'R'
     
     # 1. Geração da População Inicial
-    populacao = [gerar_rota_aleatoria(pontos, inicio) for _ in range(tam_pop)]
+    populacao = [list(rota) for rota in (populacao_inicial or [])][:tam_pop]
+    while len(populacao) < tam_pop:
+        populacao.append(gerar_rota_aleatoria(pontos, inicio))
     
     melhor_rota_global = None
     menor_custo_global = float('inf')
@@ -0,0 +1,216 @@
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from _carregador import carregar_script
+
+gerador = carregar_script("gerador-instancias.py")
+forca_bruta = carregar_script("forca-bruta.py")
+genetico = carregar_script("algoritmo-genetico.py")
+genetico_tsp = carregar_script("algoritmo-genetico-grafico.py")
+colonia = carregar_script("colonia-de-formigas-grafico.py")
+
+# --- MÓDULO 1: Adaptação das Instâncias para Cada Resolvedor ---
+
+
+def matriz_manhattan(coordenadas):
+    """
+    Matriz N x N de Distâncias de Manhattan (formato usado pelo ACO),
+    montada linha a linha para não criar temporários N x N x 2.
+    """
+    c = np.array(coordenadas)
+    matriz = np.empty((len(c), len(c)))
+    for i, (linha, coluna) in enumerate(c):
+        matriz[i] = np.abs(c[:, 0] - linha) + np.abs(c[:, 1] - coluna)
+    return matriz
+
+
+def distancias_tsp(coordenadas):
+    """Dicionário de distâncias com cidades de 1 a N (formato do AG para o TSP)."""
+    distancias = {}
+    for i, pesos in enumerate(gerador.calcular_pesos(coordenadas), start=1):
+        for j, peso in enumerate(pesos, start=i + 1):
+            distancias[(i, j)] = peso
+            distancias[(j, i)] = peso
+    return distancias
+
+
+# `preparar` converte as coordenadas (origem primeiro) para o formato do
+# resolvedor uma vez por N, fora da medição; `resolver` recebe a instância
+# convertida e retorna o custo. Os orçamentos de gerações/iterações são
+# fixos para que só N varie.
+# A Força Bruta cresce como N!, então seu expoente ajustado só serve para
+# comparar uma execução com outra.
+RESOLVEDORES = {
+    "forca-bruta": {
+        "tamanhos": [4, 5, 6, 7, 8],
+        "preparar": gerador.rotular,
+        "resolver": lambda pontos: forca_bruta.achar_menor_rota(pontos)[1],
+    },
+    "genetico": {
+        "tamanhos": [10, 20, 50, 100, 200],
+        "preparar": gerador.rotular,
+        "resolver": lambda pontos: genetico.algoritmo_genetico(
+            pontos, tam_pop=50, max_geracoes=100
+        )[1],
+    },
+    "genetico-tsp": {
+        "tamanhos": [10, 20, 50, 100, 200],
+        "preparar": lambda c: (distancias_tsp(c), len(c)),
+        "resolver": lambda instancia: genetico_tsp.algoritmo_genetico_tsp(
+            *instancia, tam_pop=50, max_geracoes=100
+        )[1],
+    },
+    "colonia-formigas": {
+        "tamanhos": [10, 20, 50, 100, 200],
+        "preparar": matriz_manhattan,
+        "resolver": lambda matriz: colonia.algoritmo_colonia_formigas(
+            matriz, len(matriz), 10, 20, 1.0, 5.0, 0.1, 100.0
+        )[1],
+    },
+}
+
+# --- MÓDULO 2: Varredura e Ajuste das Curvas ---
+
+
+def medir_tempo(resolver, instancia):
+    """Executa um resolvedor sem rastreamento de memória, medindo tempo e custo."""
+    tempo_inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        custo = resolver(instancia)
+    return {"tempo": time.perf_counter() - tempo_inicio, "custo": float(custo)}
+
+
+def medir_memoria(resolver, instancia):
+    """
+    Executa um resolvedor com o tracemalloc ativo e retorna o pico de memória.
+    Fica separado da medição de tempo porque o rastreamento deixa os laços
+    em Python bem mais lentos.
+    """
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        resolver(instancia)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico
+
+
+def ajustar_expoente(tamanhos, valores):
+    """
+    Ajusta valor ~ a * N^b por mínimos quadrados em escala log-log e
+    retorna o expoente b. São necessários pelo menos dois valores de N.
+    """
+    if len(set(tamanhos)) < 2:
+        raise ValueError("O ajuste precisa de pelo menos dois valores distintos de N.")
+    b, _ = np.polyfit(np.log(tamanhos), np.log(valores), 1)
+    return float(b)
+
+
+def executar_varredura(resolvedores, distribuicao, semente, repeticoes, tamanhos=None):
+    """
+    Roda cada resolvedor para N crescente e ajusta as curvas de escala.
+    `tamanhos` substitui os valores de N padrão das meta-heurísticas.
+    """
+    resultados = {}
+    for nome in resolvedores:
+        config = RESOLVEDORES[nome]
+        if tamanhos is None or nome == "forca-bruta":
+            tamanhos_resolvedor = config["tamanhos"]
+        else:
+            tamanhos_resolvedor = tamanhos
+        medicoes = []
+        for n in tamanhos_resolvedor:
+            coordenadas = gerador.gerar_coordenadas(n, distribuicao, semente=semente)
+            instancia = config["preparar"](coordenadas)
+            # Usa a mediana das repetições para reduzir o ruído do tempo
+            rodadas = sorted(
+                (medir_tempo(config["resolver"], instancia) for _ in range(repeticoes)),
+                key=lambda m: m["tempo"],
+            )
+            medicao = {
+                "n": n,
+                **rodadas[len(rodadas) // 2],
+                "memoria": medir_memoria(config["resolver"], instancia),
+            }
+            medicoes.append(medicao)
+            print(
+                f"{nome:>17} N={n:<5} tempo={medicao['tempo']:.4f}s "
+                f"memória={medicao['memoria'] / 1024:.0f} KiB custo={medicao['custo']:.0f}"
+            )
+        tamanhos_medidos = [m["n"] for m in medicoes]
+        resultados[nome] = {
+            "medicoes": medicoes,
+            "expoente_tempo": ajustar_expoente(
+                tamanhos_medidos, [m["tempo"] for m in medicoes]
+            ),
+            "expoente_memoria": ajustar_expoente(
+                tamanhos_medidos, [m["memoria"] for m in medicoes]
+            ),
+        }
+    return resultados
+
+
+def comparar_com_referencia(resultados, referencia, tolerancia):
+    """
+    Compara os expoentes ajustados com os de uma execução de referência.
+    Retorna a lista de regressões (expoente maior que o da referência além
+    da tolerância).
+    """
+    regressoes = []
+    for nome, resultado in resultados.items():
+        if nome not in referencia:
+            continue
+        for chave in ("expoente_tempo", "expoente_memoria"):
+            atual, anterior = resultado[chave], referencia[nome][chave]
+            if atual > anterior + tolerancia:
+                regressoes.append(f"{nome}: {chave} passou de {anterior:.2f} para {atual:.2f}")
+    return regressoes
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Varredura de escala dos resolvedores do FlyFood")
+    parser.add_argument("--resolvedores", nargs="+", choices=list(RESOLVEDORES), default=list(RESOLVEDORES))
+    parser.add_argument("--distribuicao", choices=["uniforme", "agrupada", "ruas"], default="uniforme")
+    parser.add_argument("--tamanhos", nargs="+", type=int, help="Valores de N (ex: 200 1000 10000)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default="resultado_escala.json")
+    parser.add_argument("--referencia", help="JSON de uma varredura anterior para comparação")
+    parser.add_argument("--tolerancia", type=float, default=0.3, help="Aumento aceito nos expoentes")
+    args = parser.parse_args()
+    if args.tamanhos is not None and len(set(args.tamanhos)) < 2:
+        parser.error("--tamanhos precisa de pelo menos dois valores distintos de N")
+
+    print("--- Varredura de Escala dos Resolvedores ---\n")
+    resultados = executar_varredura(
+        args.resolvedores, args.distribuicao, args.semente, args.repeticoes, args.tamanhos
+    )
+
+    print("\n--- Curvas Ajustadas (valor ~ N^b) ---")
+    for nome, resultado in resultados.items():
+        print(
+            f"{nome:>17}: tempo ~ N^{resultado['expoente_tempo']:.2f}, "
+            f"memória ~ N^{resultado['expoente_memoria']:.2f}"
+        )
+
+    with open(args.saida, "w") as f:
+        json.dump(resultados, f, indent=2)
+    print(f"\nResultados salvos em '{args.saida}'.")
+
+    if args.referencia:
+        with open(args.referencia) as f:
+            regressoes = comparar_com_referencia(resultados, json.load(f), args.tolerancia)
+        if regressoes:
+            print("\nRegressões de complexidade encontradas:")
+            for regressao in regressoes:
+                print(f"  - {regressao}")
+            sys.exit(1)
+        print("\nNenhuma regressão de complexidade em relação à referência.")
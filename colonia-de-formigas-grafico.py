@@ -1,5 +1,8 @@
+import contextlib
+import io
 import random
 import time
+import tracemalloc
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -169,7 +172,202 @@ def algoritmo_colonia_formigas(
     return melhor_caminho_global, melhor_comprimento_global, historico_comprimentos
 
 
-# --- MÓDULO 4: Funções de Plotagem ---
+# --- MÓDULO 4: Modo Compacto para Instâncias Grandes ---
+
+
+def ler_distancias_compacto(arquivo, dimensao, dtype=np.float32):
+    """
+    Lê o arquivo de distâncias linha a linha direto para uma matriz numpy
+    de `dtype` (float32 ou int32), sem montar a lista com todos os pesos.
+    """
+    matriz_distancias = np.zeros((dimensao, dimensao), dtype=dtype)
+    i, j = 0, 1  # Próxima posição do triângulo superior a ser preenchida
+    try:
+        with open(arquivo) as f:
+            for linha in f:
+                pesos = np.array(linha.split(), dtype=dtype)
+                while len(pesos) and i < dimensao - 1:
+                    trecho, pesos = pesos[: dimensao - j], pesos[dimensao - j :]
+                    matriz_distancias[i, j : j + len(trecho)] = trecho
+                    matriz_distancias[j : j + len(trecho), i] = trecho
+                    j += len(trecho)
+                    if j == dimensao:
+                        i, j = i + 1, i + 2
+    except FileNotFoundError:
+        print(f"Erro: O arquivo '{arquivo}' não foi encontrado.")
+        return None
+    print(
+        f"Matriz de distâncias de formato {matriz_distancias.shape} ({matriz_distancias.dtype}) lida com sucesso."
+    )
+    return matriz_distancias
+
+
+def construir_listas_candidatos(matriz_distancias, num_candidatos):
+    """
+    Retorna uma matriz N x k (int32) com as k cidades mais próximas de cada
+    cidade, em ordem de distância. Processa uma linha por vez para não
+    criar temporários N x N.
+    """
+    num_cidades = len(matriz_distancias)
+    k = min(num_candidatos, num_cidades - 1)
+    candidatos = np.empty((num_cidades, k), dtype=np.int32)
+    for i in range(num_cidades):
+        linha = matriz_distancias[i].astype(np.float64)
+        linha[i] = np.inf  # A própria cidade não é candidata
+        mais_proximas = np.argpartition(linha, k - 1)[:k]
+        candidatos[i] = mais_proximas[np.argsort(linha[mais_proximas])]
+    return candidatos
+
+
+def _sortear_indice(pesos):
+    """Sorteia um índice com probabilidade proporcional aos pesos."""
+    acumulado = np.cumsum(pesos)
+    if acumulado[-1] <= 0:  # Caso de estagnação ou problema numérico
+        return random.randrange(len(pesos))
+    indice = np.searchsorted(acumulado, random.random() * acumulado[-1], side="right")
+    return min(indice, len(pesos) - 1)
+
+
+def construir_caminho_formiga_compacto(
+    num_cidades,
+    candidatos,
+    feromonio_candidatos,
+    heuristica_candidatos,
+    matriz_distancias,
+    feromonio_padrao,
+    alfa,
+    beta,
+):
+    """
+    Uma formiga constrói um caminho escolhendo, sempre que possível, entre
+    as cidades candidatas ainda não visitadas. Quando todas as candidatas já
+    foram visitadas, escolhe entre as demais usando o feromônio padrão.
+    """
+    visitadas = np.zeros(num_cidades, dtype=bool)
+    caminho = np.empty(num_cidades, dtype=np.int32)
+    caminho[0] = random.randint(0, num_cidades - 1)
+    visitadas[caminho[0]] = True
+
+    for passo in range(1, num_cidades):
+        cidade_atual = caminho[passo - 1]
+        livres = ~visitadas[candidatos[cidade_atual]]
+        if livres.any():
+            pesos = (
+                feromonio_candidatos[cidade_atual, livres] ** alfa
+                * heuristica_candidatos[cidade_atual, livres]
+            )
+            proxima_cidade = candidatos[cidade_atual, livres][_sortear_indice(pesos)]
+        else:
+            nao_visitadas = np.flatnonzero(~visitadas)
+            visibilidade = (
+                1.0 / (matriz_distancias[cidade_atual, nao_visitadas] + 1e-10)
+            ) ** beta
+            pesos = feromonio_padrao**alfa * visibilidade
+            proxima_cidade = nao_visitadas[_sortear_indice(pesos)]
+        caminho[passo] = proxima_cidade
+        visitadas[proxima_cidade] = True
+
+    return caminho
+
+
+def atualizar_feromonio_compacto(
+    feromonio_candidatos, candidatos, caminhos, comprimentos, taxa_evaporacao, Q
+):
+    """
+    Atualiza o feromônio apenas nas arestas das listas de candidatos. As
+    arestas fora das listas ficam sempre com o feromônio padrão.
+    """
+    feromonio_candidatos *= 1 - taxa_evaporacao
+    for caminho, comprimento in zip(caminhos, comprimentos):
+        feromonio_depositado = Q / comprimento
+        proximas = np.roll(caminho, -1)
+        # Caminho simétrico: deposita em (a, b) e em (b, a)
+        for origem, destino in ((caminho, proximas), (proximas, caminho)):
+            linhas, colunas = np.nonzero(candidatos[origem] == destino[:, None])
+            np.add.at(
+                feromonio_candidatos, (origem[linhas], colunas), feromonio_depositado
+            )
+
+
+def algoritmo_colonia_formigas_compacto(
+    matriz_distancias,
+    num_cidades,
+    num_formigas,
+    num_iteracoes,
+    alfa,
+    beta,
+    taxa_evaporacao,
+    Q,
+    num_candidatos=15,
+    feromonio_padrao=0.1,
+):
+    """
+    Executa o ACO guardando feromônio e visibilidade só nas arestas das
+    listas de candidatos (matrizes N x k em float32), o que evita as
+    matrizes N x N de feromônio e os temporários a cada passo das formigas.
+    """
+    candidatos = construir_listas_candidatos(matriz_distancias, num_candidatos)
+    distancias_candidatos = np.take_along_axis(matriz_distancias, candidatos, axis=1)
+    heuristica_candidatos = (
+        (1.0 / (distancias_candidatos.astype(np.float32) + 1e-10)) ** beta
+    ).astype(np.float32)
+    feromonio_candidatos = np.full(
+        candidatos.shape, feromonio_padrao, dtype=np.float32
+    )
+    del distancias_candidatos
+
+    melhor_caminho_global = None
+    melhor_comprimento_global = float("inf")
+    historico_comprimentos = []
+
+    print(
+        f"\nIniciando otimização por colônia de formigas (modo compacto, {candidatos.shape[1]} candidatos)..."
+    )
+    for iteracao in range(num_iteracoes):
+        caminhos_formigas = [
+            construir_caminho_formiga_compacto(
+                num_cidades,
+                candidatos,
+                feromonio_candidatos,
+                heuristica_candidatos,
+                matriz_distancias,
+                feromonio_padrao,
+                alfa,
+                beta,
+            )
+            for _ in range(num_formigas)
+        ]
+        comprimentos_caminhos = [
+            # Soma em float64 para não perder precisão com matrizes float32
+            float(matriz_distancias[c, np.roll(c, -1)].sum(dtype=np.float64))
+            for c in caminhos_formigas
+        ]
+
+        melhor_comprimento_iteracao = min(comprimentos_caminhos)
+        if melhor_comprimento_iteracao < melhor_comprimento_global:
+            melhor_comprimento_global = melhor_comprimento_iteracao
+            melhor_caminho_global = caminhos_formigas[
+                comprimentos_caminhos.index(melhor_comprimento_iteracao)
+            ].tolist()
+            print(
+                f"Iteração {iteracao + 1:03d}: Novo melhor caminho! Comprimento: {melhor_comprimento_global:.2f}"
+            )
+
+        historico_comprimentos.append(melhor_comprimento_global)
+        atualizar_feromonio_compacto(
+            feromonio_candidatos,
+            candidatos,
+            caminhos_formigas,
+            comprimentos_caminhos,
+            taxa_evaporacao,
+            Q,
+        )
+
+    print("\nOtimização concluída.")
+    return melhor_caminho_global, melhor_comprimento_global, historico_comprimentos
+
+
+# --- MÓDULO 5: Funções de Plotagem ---
 
 
 def plotar_caminho_aco(caminho, custo, coordenadas_cidades):
@@ -245,16 +443,34 @@ if __name__ == "__main__":
     TAXA_EVAPORACAO = 0.1
     Q = 100.0  # Quantidade de feromônio
 
-    print("--- ACO para o TSP: Problema Brazil58 (Estrutura Padronizada) ---")
-
-    tempo_inicio_total = time.time()  # Mede o tempo total
-    matriz_distancias = ler_distancias_para_matriz(ARQUIVO_DISTANCIAS, NUM_CIDADES)
-
-    if matriz_distancias is not None:
-        # MODIFICADO: Inicia o cronômetro aqui
-        tempo_inicio_algoritmo = time.time()
-
-        melhor_caminho, melhor_custo, historico = algoritmo_colonia_formigas(
+    # Modo compacto: distâncias em float32 e feromônio só nas listas de
+    # candidatos (N x k), para instâncias com milhares de cidades
+    MODO_COMPACTO = False
+    NUM_CANDIDATOS = 15
+
+    # Roda leitura + algoritmo uma segunda vez com o tracemalloc ativo para
+    # medir o pico de memória (fora da medição de tempo, que ele distorce)
+    MEDIR_MEMORIA = False
+
+    def ler_distancias():
+        if MODO_COMPACTO:
+            return ler_distancias_compacto(ARQUIVO_DISTANCIAS, NUM_CIDADES)
+        return ler_distancias_para_matriz(ARQUIVO_DISTANCIAS, NUM_CIDADES)
+
+    def executar_aco(matriz_distancias):
+        if MODO_COMPACTO:
+            return algoritmo_colonia_formigas_compacto(
+                matriz_distancias,
+                NUM_CIDADES,
+                NUM_FORMIGAS,
+                NUM_ITERACOES,
+                ALFA,
+                BETA,
+                TAXA_EVAPORACAO,
+                Q,
+                NUM_CANDIDATOS,
+            )
+        return algoritmo_colonia_formigas(
             matriz_distancias,
             NUM_CIDADES,
             NUM_FORMIGAS,
@@ -265,6 +481,17 @@ if __name__ == "__main__":
             Q,
         )
 
+    print("--- ACO para o TSP: Problema Brazil58 (Estrutura Padronizada) ---")
+
+    tempo_inicio_total = time.time()  # Mede o tempo total
+    matriz_distancias = ler_distancias()
+
+    if matriz_distancias is not None:
+        # MODIFICADO: Inicia o cronômetro aqui
+        tempo_inicio_algoritmo = time.time()
+
+        melhor_caminho, melhor_custo, historico = executar_aco(matriz_distancias)
+
         # MODIFICADO: Para o cronômetro aqui
         tempo_fim_algoritmo = time.time()
         tempo_execucao_algoritmo = tempo_fim_algoritmo - tempo_inicio_algoritmo
@@ -277,6 +504,16 @@ if __name__ == "__main__":
                 f"Tempo de execução DO ALGORITMO: {tempo_execucao_algoritmo:.4f} segundos"
             )
 
+            if MEDIR_MEMORIA:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    tracemalloc.start()
+                    try:
+                        executar_aco(ler_distancias())
+                        _, pico_memoria = tracemalloc.get_traced_memory()
+                    finally:
+                        tracemalloc.stop()
+                print(f"Pico de memória (leitura + algoritmo): {pico_memoria / 2**20:.2f} MiB")
+
             coordenadas_placeholder = np.random.rand(NUM_CIDADES, 2) * 100
             plotar_caminho_aco(melhor_caminho, melhor_custo, coordenadas_placeholder)
             plotar_convergencia_aco(historico)
@@ -0,0 +1,313 @@
+import contextlib
+import io
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from _carregador import LIMITE_FORCA_BRUTA, carregar_script
+
+# Reaproveita os resolvedores existentes
+forca_bruta = carregar_script("forca-bruta.py")
+genetico = carregar_script("algoritmo-genetico.py")
+
+ler_matriz = genetico.ler_matriz
+calcular_custo_rota = genetico.calcular_custo_rota
+achar_menor_rota = forca_bruta.achar_menor_rota
+algoritmo_genetico = genetico.algoritmo_genetico
+
+# --- MÓDULO 1: Agrupamento dos Pontos de Entrega ---
+
+
+def _dividir_em_blocos(rotulos, k):
+    """Divide uma lista ordenada em k blocos contíguos de tamanhos parecidos."""
+    tamanho, resto = divmod(len(rotulos), k)
+    blocos = []
+    i = 0
+    for b in range(k):
+        fim = i + tamanho + (1 if b < resto else 0)
+        blocos.append(rotulos[i:fim])
+        i = fim
+    return [bloco for bloco in blocos if bloco]
+
+
+def _ajustar_k(num_waypoints, k, max_paradas, num_drones=None):
+    """
+    Garante que nenhum grupo ultrapasse o limite de paradas por drone. Com
+    `num_drones`, o limite vale para o total de cada drone, então são
+    formados no máximo `num_drones` grupos e cada drone recebe um só.
+    """
+    if max_paradas:
+        k = max(k, math.ceil(num_waypoints / max_paradas))
+        if num_drones:
+            k = min(k, num_drones)
+    return max(1, min(k, num_waypoints))
+
+
+def agrupar_por_varredura(pontos, k, inicio="R", max_paradas=None, num_drones=None):
+    """
+    Agrupa as entregas pelo ângulo em torno da origem (sweep): ordena os
+    pontos pelo ângulo e divide a sequência em k fatias contíguas.
+    """
+    waypoints = [p for p in pontos if p != inicio]
+    if not waypoints:
+        return []
+    k = _ajustar_k(len(waypoints), k, max_paradas, num_drones)
+    origem = pontos[inicio]
+    waypoints.sort(
+        key=lambda p: math.atan2(
+            pontos[p]["linha"] - origem["linha"], pontos[p]["coluna"] - origem["coluna"]
+        )
+    )
+    return _dividir_em_blocos(waypoints, k)
+
+
+def agrupar_por_kmeans(
+    pontos,
+    k,
+    inicio="R",
+    max_paradas=None,
+    num_drones=None,
+    max_iteracoes=50,
+    semente=None,
+):
+    """
+    Agrupa as entregas com k-means sobre as coordenadas (linha, coluna).
+    Com `max_paradas`, cada ponto vai para o centro mais próximo que ainda
+    tem vaga, atendendo primeiro os pontos mais próximos de algum centro.
+    """
+    waypoints = [p for p in pontos if p != inicio]
+    if not waypoints:
+        return []
+    k = _ajustar_k(len(waypoints), k, max_paradas, num_drones)
+    gerador = random.Random(semente)
+    centros = [
+        (pontos[p]["linha"], pontos[p]["coluna"]) for p in gerador.sample(waypoints, k)
+    ]
+    capacidade = max_paradas or len(waypoints)
+
+    def dist_centro(p, c):
+        return abs(pontos[p]["linha"] - c[0]) + abs(pontos[p]["coluna"] - c[1])
+
+    grupos = []
+    for _ in range(max_iteracoes):
+        # Atribuição (respeitando a capacidade de cada grupo)
+        grupos = [[] for _ in range(k)]
+        ordem = sorted(waypoints, key=lambda p: min(dist_centro(p, c) for c in centros))
+        for p in ordem:
+            for indice in sorted(range(k), key=lambda i: dist_centro(p, centros[i])):
+                if len(grupos[indice]) < capacidade:
+                    grupos[indice].append(p)
+                    break
+
+        # Atualização dos centros
+        novos_centros = []
+        for indice, grupo in enumerate(grupos):
+            if grupo:
+                novos_centros.append(
+                    (
+                        sum(pontos[p]["linha"] for p in grupo) / len(grupo),
+                        sum(pontos[p]["coluna"] for p in grupo) / len(grupo),
+                    )
+                )
+            else:
+                novos_centros.append(centros[indice])
+        if novos_centros == centros:
+            break
+        centros = novos_centros
+
+    # Ordena os grupos pelo ângulo do centro em torno da origem, como na varredura
+    origem = pontos[inicio]
+    grupos = [(grupo, centros[i]) for i, grupo in enumerate(grupos) if grupo]
+    grupos.sort(
+        key=lambda g: math.atan2(g[1][0] - origem["linha"], g[1][1] - origem["coluna"])
+    )
+    return [grupo for grupo, _ in grupos]
+
+
+# --- MÓDULO 2: Resolução dos Grupos em Paralelo ---
+
+
+def resolver_grupo(pontos_grupo, tam_pop=100, max_geracoes=500):
+    """
+    Resolve um subproblema (origem + entregas do grupo) com a Força Bruta,
+    se for pequeno, ou com o Algoritmo Genético. As mensagens de progresso
+    dos resolvedores são descartadas para não misturar a saída dos processos.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        if len(pontos_grupo) - 1 <= LIMITE_FORCA_BRUTA:
+            return achar_menor_rota(pontos_grupo)
+        return algoritmo_genetico(
+            pontos_grupo, tam_pop=tam_pop, max_geracoes=max_geracoes
+        )
+
+
+def costurar_rotas(rotas, pontos, inicio="R"):
+    """
+    Junta as rotas dos grupos em um único percurso, escolhendo para cada
+    rota o sentido que liga melhor ao último ponto visitado.
+    """
+    rota_final = []
+    for rota in rotas:
+        if not rota:
+            continue
+        ultimo = pontos[rota_final[-1]] if rota_final else pontos[inicio]
+
+        def ligacao(p):
+            return abs(ultimo["linha"] - pontos[p]["linha"]) + abs(
+                ultimo["coluna"] - pontos[p]["coluna"]
+            )
+
+        rota_final += rota if ligacao(rota[0]) <= ligacao(rota[-1]) else rota[::-1]
+    return rota_final
+
+
+def distribuir_entre_drones(rotas, custos, num_drones, max_paradas=None):
+    """
+    Distribui as rotas (cada uma sai e volta para a origem) entre os drones,
+    sempre entregando a rota restante com mais paradas ao drone menos
+    carregado que ainda a comporte. Com `max_paradas`, nenhum drone passa
+    desse total de entregas somando todas as suas viagens.
+    """
+    drones = [{"rotas": [], "custo": 0, "paradas": 0} for _ in range(num_drones)]
+    ordem = sorted(
+        range(len(rotas)), key=lambda i: (len(rotas[i]), custos[i]), reverse=True
+    )
+    for indice in ordem:
+        livres = [
+            d
+            for d in drones
+            if not max_paradas or d["paradas"] + len(rotas[indice]) <= max_paradas
+        ]
+        if not livres:
+            raise ValueError(
+                f"Não foi possível distribuir as viagens entre {num_drones} drones "
+                f"com no máximo {max_paradas} paradas cada; reduza k ou aumente o limite."
+            )
+        drone = min(livres, key=lambda d: d["custo"])
+        drone["rotas"].append(rotas[indice])
+        drone["custo"] += custos[indice]
+        drone["paradas"] += len(rotas[indice])
+    return drones
+
+
+def resolver_decomposto(
+    pontos,
+    k,
+    metodo="varredura",
+    inicio="R",
+    max_paradas=None,
+    num_drones=None,
+    max_processos=None,
+    tam_pop=100,
+    max_geracoes=500,
+):
+    """
+    Resolve o problema por "agrupar primeiro, roteirizar depois".
+
+    Sem `num_drones`, as rotas dos grupos são costuradas em um único
+    percurso e a função retorna (rota, custo). Com `num_drones`, cada grupo
+    vira uma viagem saindo de `inicio` e a função retorna a lista de drones,
+    cada um com suas viagens e custo total. `max_paradas` limita as entregas
+    de cada grupo e, com `num_drones`, também o total de entregas por drone
+    (nesse caso `k` é reduzido para no máximo `num_drones` grupos).
+    """
+    num_entregas = len(pontos) - 1
+    if num_drones and max_paradas and num_entregas > num_drones * max_paradas:
+        raise ValueError(
+            f"{num_entregas} entregas não cabem em {num_drones} drones "
+            f"com no máximo {max_paradas} paradas cada."
+        )
+
+    if metodo == "varredura":
+        grupos = agrupar_por_varredura(pontos, k, inicio, max_paradas, num_drones)
+    elif metodo == "kmeans":
+        grupos = agrupar_por_kmeans(pontos, k, inicio, max_paradas, num_drones)
+    else:
+        raise ValueError(f"Método de agrupamento desconhecido: '{metodo}'.")
+
+    subproblemas = [
+        {inicio: pontos[inicio], **{p: pontos[p] for p in grupo}} for grupo in grupos
+    ]
+    with ProcessPoolExecutor(max_workers=max_processos) as executor:
+        resultados = list(
+            executor.map(
+                resolver_grupo,
+                subproblemas,
+                [tam_pop] * len(subproblemas),
+                [max_geracoes] * len(subproblemas),
+            )
+        )
+
+    rotas = [rota for rota, _ in resultados]
+    if num_drones:
+        return distribuir_entre_drones(
+            rotas, [custo for _, custo in resultados], num_drones, max_paradas
+        )
+
+    # Os grupos já vêm em ordem angular, então a costura segue essa ordem
+    rota = costurar_rotas(rotas, pontos, inicio)
+    return rota, calcular_custo_rota(rota, pontos, inicio)
+
+
+# --- MÓDULO 3: Comparação com a Solução Monolítica ---
+
+
+def gerar_pontos_aleatorios(num_pontos, tamanho_grade, semente=None):
+    """Gera um cenário aleatório no formato de `ler_matriz`, com 'R' no centro."""
+    gerador = random.Random(semente)
+    celulas = gerador.sample(range(tamanho_grade * tamanho_grade), num_pontos)
+    pontos = {"R": {"linha": tamanho_grade // 2, "coluna": tamanho_grade // 2}}
+    for indice, celula in enumerate(celulas):
+        linha, coluna = divmod(celula, tamanho_grade)
+        if (linha, coluna) != (pontos["R"]["linha"], pontos["R"]["coluna"]):
+            pontos[f"P{indice}"] = {"linha": linha, "coluna": coluna}
+    return pontos
+
+
+def comparar_com_monolitico(tamanhos, k=4, tam_pop=100, max_geracoes=200, semente=42):
+    """Mede tempo e custo da solução decomposta contra o AG monolítico para cada N."""
+    print(f"{'N':>6} {'t_mono (s)':>12} {'custo_mono':>11} {'t_decomp (s)':>13} {'custo_decomp':>13}")
+    for n in tamanhos:
+        pontos = gerar_pontos_aleatorios(n, tamanho_grade=max(10, 2 * n), semente=semente)
+
+        tempo_inicio = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, custo_mono = algoritmo_genetico(
+                pontos, tam_pop=tam_pop, max_geracoes=max_geracoes
+            )
+        tempo_mono = time.time() - tempo_inicio
+
+        tempo_inicio = time.time()
+        _, custo_decomp = resolver_decomposto(
+            pontos, k, tam_pop=tam_pop, max_geracoes=max_geracoes
+        )
+        tempo_decomp = time.time() - tempo_inicio
+
+        print(f"{n:>6} {tempo_mono:>12.4f} {custo_mono:>11} {tempo_decomp:>13.4f} {custo_decomp:>13}")
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    arquivo_cenario = "cenario3.txt"
+
+    print("--- Decomposição em Grupos para o FlyFood ---")
+    print(f"Lendo o arquivo: {arquivo_cenario}\n")
+
+    pontos = ler_matriz(arquivo_cenario)
+
+    if pontos:
+        tempo_inicio = time.time()
+        rota, dist = resolver_decomposto(pontos, k=2)
+        print(f"Rota costurada (1 drone): R -> {' -> '.join(rota)} -> R")
+        print(f"Distância Total: {dist}")
+
+        drones = resolver_decomposto(pontos, k=3, max_paradas=6, num_drones=2)
+        for i, drone in enumerate(drones, start=1):
+            viagens = " | ".join(f"R -> {' -> '.join(r)} -> R" for r in drone["rotas"])
+            print(f"Drone {i} (custo {drone['custo']}): {viagens}")
+        print(f"\nTempo de execução: {time.time() - tempo_inicio:.4f} segundos")
+
+    print("\n--- Comparação com a solução monolítica (AG) ---")
+    comparar_com_monolitico([20, 50, 100, 200])
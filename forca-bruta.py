@@ -1,32 +1,56 @@
+import itertools
 import time
 
-def ler_matriz(arquivo):
+def ler_pontos_linhas(linhas):
     """
-    Lê o arquivo de texto, encontra os pontos e retorna um dicionário
-    com seus rótulos e coordenadas.
+    Lê os pontos a partir de um iterável de linhas (arquivo aberto, lista de
+    strings...), uma linha por vez, sem guardar a grade inteira na memória.
+
+    Aceita dois formatos:
+      - Grade: células separadas por espaço, com '0' nas vazias. Os rótulos
+        podem ter vários caracteres (ex: "P12"), desde que não sejam números.
+        Uma primeira linha com as dimensões (ex: "4 5") é ignorada.
+      - Esparso: primeira linha "esparso", seguida de "rotulo linha coluna"
+        para cada ponto.
     """
     pontos = {}
+    linhas = iter(linhas)
+    primeira = next(linhas, '')
+    tokens = primeira.split()
+
+    # Formato esparso: um ponto por linha
+    if len(tokens) == 1 and tokens[0].lower() == 'esparso':
+        for linha in linhas:
+            tokens = linha.split()
+            if tokens:
+                rotulo, i, j = tokens
+                pontos[rotulo] = {'linha': int(i), 'coluna': int(j)}
+        return pontos
+
+    # Se a primeira linha não for a dimensão da grade, ela já faz parte da grade
+    if not (len(tokens) == 2 and tokens[0].isdigit() and tokens[1].isdigit()):
+        linhas = itertools.chain([primeira], linhas)
+
+    for i, linha in enumerate(linhas):
+        # Linhas só com zeros (a maioria em grades grandes) nem são divididas
+        if not linha.strip(' 0\t\r\n'):
+            continue
+        for j, celula in enumerate(linha.split()):
+            if celula[0].isalpha():  # Rótulos começam com letra (R, A, P12...)
+                pontos[celula] = {'linha': i, 'coluna': j}
+    return pontos
+
+def ler_matriz(arquivo):
+    """
+    Lê o arquivo de texto (grade ou formato esparso), encontra os pontos e
+    retorna um dicionário com seus rótulos e coordenadas.
+    """
     try:
         with open(arquivo) as f:
-            matriz = f.readlines()
-            
-            # Tenta pular a primeira linha se ela contiver as dimensões (ex: "4 5")
-            try:
-                int(matriz[0].strip()[0]) # Se o primeiro caractere for um número, assume que é a linha de dimensão
-                matriz = matriz[1:]
-            except (ValueError, IndexError):
-                pass # Se não for número, provavelmente já é a matriz
-
-            for i, linha in enumerate(matriz):
-                # Usamos split() para lidar com espaços entre os caracteres, como em "R 0 B 0 0"
-                for j, char in enumerate(linha.strip().split()):
-                    if char.isalpha():
-                        pontos[char] = {'linha': i, 'coluna': j}
+            return ler_pontos_linhas(f)
     except FileNotFoundError:
         print(f"Erro: O arquivo '{arquivo}' não foi encontrado.")
         return None
-        
-    return pontos
 
 def distancia(ponto_a, ponto_b):
     """Calcula a Distância de Manhattan entre dois pontos."""
@@ -0,0 +1,143 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# --- MÓDULO 1: Geração dos Pedidos ---
+
+
+def gerar_cenario_aleatorio(num_pontos, tamanho_grade, gerador):
+    """Gera o texto de um cenário no formato dos arquivos `cenario*.txt`."""
+    grade = [["0"] * tamanho_grade for _ in range(tamanho_grade)]
+    celulas = gerador.sample(range(tamanho_grade * tamanho_grade), num_pontos + 1)
+    rotulos = ["R"] + [chr(ord("A") + i) for i in range(num_pontos)]
+    for rotulo, celula in zip(rotulos, celulas):
+        linha, coluna = divmod(celula, tamanho_grade)
+        grade[linha][coluna] = rotulo
+    linhas = [f"{tamanho_grade} {tamanho_grade}"] + [" ".join(l) for l in grade]
+    return "\n".join(linhas)
+
+
+def montar_pedidos(num_pedidos, taxa_repeticao, semente=None):
+    """
+    Monta a lista de pedidos: uma fração `taxa_repeticao` repete cenários já
+    enviados (para exercitar o cache) e o resto são cenários novos.
+    """
+    gerador = random.Random(semente)
+    base = []
+    for nome in ("cenario1.txt", "cenario2.txt", "cenario3.txt"):
+        with open(os.path.join(DIRETORIO, nome)) as f:
+            base.append({"formato": "grade", "conteudo": f.read()})
+
+    pedidos = []
+    for _ in range(num_pedidos):
+        if pedidos and gerador.random() < taxa_repeticao:
+            pedidos.append(gerador.choice(pedidos))
+        elif gerador.random() < 0.2:
+            pedidos.append(gerador.choice(base))
+        else:
+            conteudo = gerar_cenario_aleatorio(gerador.randint(3, 7), 10, gerador)
+            pedidos.append({"formato": "grade", "conteudo": conteudo})
+    return pedidos
+
+
+# --- MÓDULO 2: Clientes HTTP Concorrentes ---
+
+
+async def abrir_conexao(host, porta, caminho_unix):
+    if caminho_unix:
+        return await asyncio.open_unix_connection(caminho_unix)
+    return await asyncio.open_connection(host, porta)
+
+
+async def enviar_pedido(leitor, escritor, pedido):
+    """Envia um POST /resolver na conexão aberta e retorna a resposta."""
+    corpo = json.dumps(pedido).encode()
+    escritor.write(
+        "POST /resolver HTTP/1.1\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(corpo)}\r\n\r\n".encode()
+        + corpo
+    )
+    await escritor.drain()
+
+    linha_status = await leitor.readline()
+    tamanho = 0
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b"\n", b""):
+            break
+        nome, _, valor = linha.decode().partition(":")
+        if nome.strip().lower() == "content-length":
+            tamanho = int(valor)
+    resposta = json.loads(await leitor.readexactly(tamanho))
+    return linha_status.decode().split(" ", 2)[1], resposta
+
+
+async def cliente(fila, latencias, erros, host, porta, caminho_unix):
+    """Um cliente com conexão persistente que consome pedidos da fila."""
+    leitor, escritor = await abrir_conexao(host, porta, caminho_unix)
+    try:
+        while True:
+            try:
+                pedido = fila.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            tempo_inicio = time.perf_counter()
+            status, _ = await enviar_pedido(leitor, escritor, pedido)
+            latencias.append(time.perf_counter() - tempo_inicio)
+            if status != "200":
+                erros.append(status)
+    finally:
+        escritor.close()
+
+
+def percentil(valores_ordenados, p):
+    """Percentil pelo método do posto mais próximo."""
+    indice = max(0, min(len(valores_ordenados) - 1, round(p / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+async def executar_carga(pedidos, concorrencia, host, porta, caminho_unix):
+    fila = asyncio.Queue()
+    for pedido in pedidos:
+        fila.put_nowait(pedido)
+    latencias, erros = [], []
+
+    tempo_inicio = time.perf_counter()
+    await asyncio.gather(
+        *[
+            cliente(fila, latencias, erros, host, porta, caminho_unix)
+            for _ in range(concorrencia)
+        ]
+    )
+    tempo_total = time.perf_counter() - tempo_inicio
+
+    latencias.sort()
+    print(f"\n--- Resultado da Carga ---")
+    print(f"Pedidos: {len(latencias)} (erros: {len(erros)})")
+    print(f"Vazão: {len(latencias) / tempo_total:.1f} pedidos/s")
+    print(f"Latência p50: {percentil(latencias, 50) * 1000:.2f} ms")
+    print(f"Latência p99: {percentil(latencias, 99) * 1000:.2f} ms")
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gerador de carga para o servico-rotas.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--unix", help="Caminho do socket Unix do serviço")
+    parser.add_argument("--pedidos", type=int, default=500)
+    parser.add_argument("--concorrencia", type=int, default=16)
+    parser.add_argument("--repeticao", type=float, default=0.5, help="Fração de pedidos repetidos")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    pedidos = montar_pedidos(args.pedidos, args.repeticao, args.semente)
+    print(f"Enviando {len(pedidos)} pedidos com {args.concorrencia} clientes...")
+    asyncio.run(executar_carga(pedidos, args.concorrencia, args.host, args.porta, args.unix))
@@ -0,0 +1,143 @@
+import argparse
+import random
+
+# --- MÓDULO 1: Geração das Coordenadas ---
+
+
+def gerar_coordenadas(num_entregas, distribuicao="uniforme", tamanho=None, semente=None):
+    """
+    Gera as coordenadas (linha, coluna) da origem e de `num_entregas`
+    pontos de entrega, sem repetir células. A origem é sempre a primeira.
+
+    Distribuições:
+      - "uniforme": pontos espalhados por toda a grade.
+      - "agrupada": pontos concentrados em alguns bairros (gaussianas).
+      - "ruas": pontos apenas sobre as ruas de uma malha de quarteirões.
+    """
+    gerador = random.Random(semente)
+    total = num_entregas + 1
+    # Grade grande o bastante para os pontos caberem com folga
+    tamanho = tamanho or max(10, int((total * 10) ** 0.5) + 1)
+    if total > tamanho * tamanho:
+        raise ValueError(f"Não cabem {total} pontos em uma grade {tamanho}x{tamanho}.")
+
+    if distribuicao == "uniforme":
+        celulas = gerador.sample(range(tamanho * tamanho), total)
+        return [divmod(c, tamanho) for c in celulas]
+
+    coordenadas = []
+    usadas = set()
+    if distribuicao == "agrupada":
+        num_bairros = max(1, total // 50)
+        bairros = [
+            (gerador.uniform(0, tamanho - 1), gerador.uniform(0, tamanho - 1))
+            for _ in range(num_bairros)
+        ]
+        dispersao = max(1.0, tamanho / (4 * num_bairros**0.5))
+
+        def sortear():
+            centro = gerador.choice(bairros)
+            return tuple(
+                min(tamanho - 1, max(0, round(gerador.gauss(c, dispersao)))) for c in centro
+            )
+
+    elif distribuicao == "ruas":
+        quadra = 5
+        num_ruas = len(range(0, tamanho, quadra))
+        if total > 2 * num_ruas * tamanho - num_ruas * num_ruas:
+            raise ValueError(f"Não cabem {total} pontos nas ruas de uma grade {tamanho}x{tamanho}.")
+
+        def sortear():
+            rua = gerador.randrange(0, tamanho, quadra)
+            posicao = gerador.randrange(tamanho)
+            return (rua, posicao) if gerador.random() < 0.5 else (posicao, rua)
+
+    else:
+        raise ValueError(f"Distribuição desconhecida: '{distribuicao}'.")
+
+    while len(coordenadas) < total:
+        celula = sortear()
+        if celula not in usadas:
+            usadas.add(celula)
+            coordenadas.append(celula)
+    return coordenadas
+
+
+def rotular(coordenadas):
+    """Monta o dicionário de pontos no formato de `ler_matriz` ('R', 'P1', 'P2'...)."""
+    pontos = {}
+    for indice, (linha, coluna) in enumerate(coordenadas):
+        rotulo = "R" if indice == 0 else f"P{indice}"
+        pontos[rotulo] = {"linha": linha, "coluna": coluna}
+    return pontos
+
+
+# --- MÓDULO 2: Escrita dos Arquivos ---
+
+
+def escrever_grade(arquivo, pontos):
+    """Escreve o cenário como grade (formato dos arquivos `cenario*.txt`)."""
+    num_linhas = max(p["linha"] for p in pontos.values()) + 1
+    num_colunas = max(p["coluna"] for p in pontos.values()) + 1
+    por_linha = {}
+    for rotulo, p in pontos.items():
+        por_linha.setdefault(p["linha"], {})[p["coluna"]] = rotulo
+
+    linha_vazia = " ".join(["0"] * num_colunas) + "\n"
+    with open(arquivo, "w") as f:
+        f.write(f"{num_linhas} {num_colunas}\n")
+        # Escreve uma linha por vez para não montar a grade inteira na memória
+        for i in range(num_linhas):
+            if i not in por_linha:
+                f.write(linha_vazia)
+            else:
+                celulas = por_linha[i]
+                f.write(" ".join(celulas.get(j, "0") for j in range(num_colunas)) + "\n")
+
+
+def escrever_esparso(arquivo, pontos):
+    """Escreve o cenário no formato esparso ("rotulo linha coluna")."""
+    with open(arquivo, "w") as f:
+        f.write("esparso\n")
+        for rotulo, p in pontos.items():
+            f.write(f"{rotulo} {p['linha']} {p['coluna']}\n")
+
+
+def calcular_pesos(coordenadas):
+    """Distâncias de Manhattan do triângulo superior, linha a linha."""
+    for i in range(len(coordenadas) - 1):
+        li, ci = coordenadas[i]
+        yield [abs(li - lj) + abs(ci - cj) for lj, cj in coordenadas[i + 1 :]]
+
+
+def escrever_arestas(arquivo, coordenadas):
+    """
+    Escreve a instância como pesos de arestas no formato de
+    `edgesbrasil58.txt`: a linha i traz as distâncias da cidade i às
+    cidades seguintes.
+    """
+    with open(arquivo, "w") as f:
+        for pesos in calcular_pesos(coordenadas):
+            f.write(" ".join(map(str, pesos)) + " \n")
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gerador de instâncias sintéticas do FlyFood")
+    parser.add_argument("saida", help="Arquivo a ser gerado")
+    parser.add_argument("--n", type=int, default=100, help="Número de pontos de entrega")
+    parser.add_argument("--distribuicao", choices=["uniforme", "agrupada", "ruas"], default="uniforme")
+    parser.add_argument("--formato", choices=["grade", "esparso", "arestas"], default="grade")
+    parser.add_argument("--tamanho", type=int, default=None, help="Lado da grade")
+    parser.add_argument("--semente", type=int, default=None)
+    args = parser.parse_args()
+
+    coordenadas = gerar_coordenadas(args.n, args.distribuicao, args.tamanho, args.semente)
+    if args.formato == "arestas":
+        escrever_arestas(args.saida, coordenadas)
+    elif args.formato == "esparso":
+        escrever_esparso(args.saida, rotular(coordenadas))
+    else:
+        escrever_grade(args.saida, rotular(coordenadas))
+    print(f"Instância com {args.n} entregas ({args.distribuicao}) salva em '{args.saida}'.")
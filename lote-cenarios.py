@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from _carregador import carregar_script
+
+# Reaproveita a leitura canônica das instâncias e a escolha do resolvedor
+# (Força Bruta para poucos pontos, Algoritmo Genético para o resto)
+servico = carregar_script("servico-rotas.py")
+
+normalizar_pedido = servico.normalizar_pedido
+resolver_instancia = servico.resolver_instancia
+aquecer_processo = servico.aquecer_processo
+
+# --- MÓDULO 1: Leitura dos Cenários em Fluxo ---
+
+
+def ler_pedidos_jsonl(arquivo):
+    """
+    Lê um pedido por linha de um arquivo JSONL, no mesmo formato aceito pelo
+    servico-rotas.py. O campo opcional "id" identifica o cenário na saída.
+    Uma linha que não é JSON válido é entregue como a própria exceção, para
+    virar um registro de erro sem interromper o lote.
+    """
+    with open(arquivo) as f:
+        for numero, linha in enumerate(f, start=1):
+            if linha.strip():
+                try:
+                    pedido = json.loads(linha)
+                except ValueError as erro:
+                    yield numero, erro
+                    continue
+                identificador = pedido.get("id", numero) if isinstance(pedido, dict) else numero
+                yield identificador, pedido
+
+
+def ler_pedidos_diretorio(diretorio):
+    """Lê cada arquivo .txt de um diretório como um cenário em grade."""
+    for nome in sorted(os.listdir(diretorio)):
+        if nome.endswith(".txt"):
+            with open(os.path.join(diretorio, nome)) as f:
+                yield nome, {"formato": "grade", "conteudo": f.read()}
+
+
+# --- MÓDULO 2: Resolução em Lote ---
+
+
+def resolver_lote(pedidos, num_processos=None, janela=None, tam_cache=4096):
+    """
+    Resolve os pedidos em um pool de processos e devolve os resultados na
+    mesma ordem de entrada, à medida que ficam prontos.
+
+    Instâncias idênticas (mesmo hash canônico) são resolvidas uma única vez
+    enquanto estiverem entre as `tam_cache` mais recentes (cache LRU). No
+    máximo `janela` pedidos ficam pendentes, para que a leitura da entrada
+    não se adiante demais em relação à resolução. Pedidos inválidos ou que
+    falham na resolução viram registros {"id": ..., "erro": ...}.
+    """
+    num_processos = num_processos or os.cpu_count() or 1
+    janela = janela or 4 * num_processos
+    resolvidos = OrderedDict()  # hash -> futuro
+    pendentes = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=num_processos, initializer=aquecer_processo
+    ) as executor:
+        for identificador, pedido in pedidos:
+            try:
+                if isinstance(pedido, Exception):
+                    raise pedido
+                instancia, chave = normalizar_pedido(pedido)
+            except Exception as erro:
+                # Nenhuma linha de entrada pode interromper o lote
+                pendentes.append((identificador, None, False, str(erro)))
+            else:
+                duplicado = chave in resolvidos
+                if duplicado:
+                    resolvidos.move_to_end(chave)
+                else:
+                    resolvidos[chave] = executor.submit(resolver_instancia, instancia)
+                    if len(resolvidos) > tam_cache:
+                        resolvidos.popitem(last=False)  # Remove o menos usado recentemente
+                pendentes.append((identificador, resolvidos[chave], duplicado, None))
+
+            while len(pendentes) > janela:
+                yield _montar_resultado(*pendentes.popleft())
+
+        while pendentes:
+            yield _montar_resultado(*pendentes.popleft())
+
+
+def _montar_resultado(identificador, futuro, duplicado, erro):
+    if erro is None:
+        try:
+            return {"id": identificador, **futuro.result(), "duplicado": duplicado}
+        except Exception as falha:
+            erro = f"{type(falha).__name__}: {falha}"
+    return {"id": identificador, "erro": erro}
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolução em lote de cenários do FlyFood")
+    parser.add_argument("entrada", help="Arquivo JSONL de pedidos ou diretório com cenários .txt")
+    parser.add_argument("--saida", help="Arquivo JSONL de resultados (padrão: saída padrão)")
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--cache", type=int, default=4096, help="Instâncias lembradas para deduplicação")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.entrada):
+        pedidos = ler_pedidos_diretorio(args.entrada)
+    else:
+        pedidos = ler_pedidos_jsonl(args.entrada)
+
+    saida = open(args.saida, "w") if args.saida else sys.stdout
+    tempo_inicio = time.time()
+    total = duplicados = erros = 0
+    try:
+        for resultado in resolver_lote(pedidos, args.processos, tam_cache=args.cache):
+            saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            total += 1
+            duplicados += resultado.get("duplicado", False)
+            erros += "erro" in resultado
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    tempo_execucao = time.time() - tempo_inicio
+    print(
+        f"\n{total} cenários ({duplicados} duplicados, {erros} com erro) em "
+        f"{tempo_execucao:.4f} segundos: {total / tempo_execucao:.1f} cenários/s",
+        file=sys.stderr,
+    )
@@ -0,0 +1,189 @@
+import random
+import time
+
+from _carregador import carregar_script
+
+# Reaproveita a leitura do cenário e os operadores do Algoritmo Genético
+genetico = carregar_script("algoritmo-genetico.py")
+
+ler_matriz = genetico.ler_matriz
+calcular_custo_rota = genetico.calcular_custo_rota
+mutacao_por_inversao = genetico.mutacao_por_inversao
+algoritmo_genetico = genetico.algoritmo_genetico
+
+# --- MÓDULO 1: Aplicação das Alterações no Pedido ---
+
+
+def distancia(ponto_a, ponto_b):
+    """Calcula a Distância de Manhattan entre dois pontos."""
+    return abs(ponto_a["linha"] - ponto_b["linha"]) + abs(
+        ponto_a["coluna"] - ponto_b["coluna"]
+    )
+
+
+def aplicar_alteracoes(pontos, adicionados=None, removidos=None, inicio="R"):
+    """
+    Retorna um novo dicionário de pontos com as entregas adicionadas e
+    removidas. `adicionados` segue o formato de `ler_matriz`
+    ({'rotulo': {'linha': i, 'coluna': j}}) e `removidos` é uma lista de rótulos.
+    """
+    novos_pontos = dict(pontos)
+    for rotulo in removidos or []:
+        if rotulo == inicio:
+            raise ValueError(f"O ponto de origem '{inicio}' não pode ser removido.")
+        novos_pontos.pop(rotulo, None)
+    novos_pontos.update(adicionados or {})
+    return novos_pontos
+
+
+def insercao_mais_barata(rota, novos_rotulos, pontos, inicio="R"):
+    """
+    Insere cada novo ponto na posição da rota que causa o menor aumento de
+    custo. A origem é considerada nas duas pontas do ciclo.
+    """
+    rota = list(rota)
+    for rotulo in novos_rotulos:
+        ponto_novo = pontos[rotulo]
+        ciclo = [inicio] + rota + [inicio]
+        melhor_posicao = 0
+        menor_acrescimo = float("inf")
+        # Testa a inserção entre cada par de pontos consecutivos do ciclo
+        for i in range(len(ciclo) - 1):
+            a, b = pontos[ciclo[i]], pontos[ciclo[i + 1]]
+            acrescimo = (
+                distancia(a, ponto_novo)
+                + distancia(ponto_novo, b)
+                - distancia(a, b)
+            )
+            if acrescimo < menor_acrescimo:
+                menor_acrescimo = acrescimo
+                melhor_posicao = i
+        rota.insert(melhor_posicao, rotulo)
+    return rota
+
+
+# --- MÓDULO 2: Reparo Local da Rota ---
+
+
+def reparo_2opt(rota, pontos, inicio="R", max_passadas=50):
+    """
+    Melhora a rota com movimentos 2-opt (inversão de segmentos) até não
+    haver mais ganho ou atingir `max_passadas`.
+    """
+    rota = list(rota)
+    n = len(rota)
+    for _ in range(max_passadas):
+        houve_melhora = False
+        for i in range(n - 1):
+            anterior = pontos[rota[i - 1]] if i > 0 else pontos[inicio]
+            for j in range(i + 1, n):
+                seguinte = pontos[rota[j + 1]] if j < n - 1 else pontos[inicio]
+                # Ganho ao trocar as arestas (anterior, i) e (j, seguinte)
+                # por (anterior, j) e (i, seguinte)
+                delta = (
+                    distancia(anterior, pontos[rota[j]])
+                    + distancia(pontos[rota[i]], seguinte)
+                    - distancia(anterior, pontos[rota[i]])
+                    - distancia(pontos[rota[j]], seguinte)
+                )
+                if delta < 0:
+                    rota[i : j + 1] = reversed(rota[i : j + 1])
+                    houve_melhora = True
+        if not houve_melhora:
+            break
+    return rota
+
+
+# --- MÓDULO 3: Reotimização Incremental ---
+
+
+def reotimizar_rota(
+    rota_anterior,
+    pontos,
+    adicionados=None,
+    removidos=None,
+    inicio="R",
+    metodo="2opt",
+    tam_pop=30,
+    max_geracoes=50,
+    taxa_mutacao=0.02,
+):
+    """
+    Replaneja uma rota a partir da melhor rota anterior e das alterações no
+    pedido, sem resolver o problema do zero.
+
+    1. Remove da rota os pontos retirados e aplica inserção mais barata
+       para os pontos novos.
+    2. Repara a rota com 2-opt (`metodo='2opt'`) ou, com `metodo='genetico'`,
+       executa um AG curto cuja população inicial parte da rota reparada.
+
+    Retorna (nova_rota, custo, novos_pontos).
+    """
+    if metodo not in ("2opt", "genetico"):
+        raise ValueError(f"Método de reotimização desconhecido: '{metodo}'.")
+
+    novos_pontos = aplicar_alteracoes(pontos, adicionados, removidos, inicio)
+
+    # 1. Mantém a ordem dos pontos que continuam no pedido
+    rota = [p for p in rota_anterior if p in novos_pontos and p != inicio]
+    ja_na_rota = set(rota)
+    novos_rotulos = [p for p in novos_pontos if p != inicio and p not in ja_na_rota]
+    rota = insercao_mais_barata(rota, novos_rotulos, novos_pontos, inicio)
+
+    # 2. Reparo local
+    rota = reparo_2opt(rota, novos_pontos, inicio)
+    if metodo == "genetico" and len(rota) > 1:
+        # População aquecida: a rota reparada e variações dela por inversão
+        populacao_inicial = [rota] + [
+            mutacao_por_inversao(list(rota), 1.0) for _ in range(tam_pop - 1)
+        ]
+        rota_ag, custo_ag = algoritmo_genetico(
+            novos_pontos,
+            tam_pop=tam_pop,
+            max_geracoes=max_geracoes,
+            taxa_mutacao=taxa_mutacao,
+            populacao_inicial=populacao_inicial,
+        )
+        if custo_ag < calcular_custo_rota(rota, novos_pontos, inicio):
+            rota = rota_ag
+
+    return rota, calcular_custo_rota(rota, novos_pontos, inicio), novos_pontos
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    arquivo_cenario = "cenario3.txt"
+
+    print("--- Reotimização Incremental para o FlyFood ---")
+    print(f"Lendo o arquivo: {arquivo_cenario}\n")
+
+    pontos = ler_matriz(arquivo_cenario)
+
+    if pontos:
+        # Solução "a frio", como seria feita hoje a cada mudança no pedido
+        tempo_inicio = time.time()
+        rota, custo = algoritmo_genetico(pontos, tam_pop=100, max_geracoes=500)
+        tempo_frio = time.time() - tempo_inicio
+
+        # Alteração no pedido: sai uma entrega e entram duas novas
+        adicionados = {
+            "K": {"linha": random.randint(0, 7), "coluna": random.randint(0, 7)},
+            "L": {"linha": random.randint(0, 7), "coluna": random.randint(0, 7)},
+        }
+        removidos = ["J"]
+
+        for metodo in ("2opt", "genetico"):
+            tempo_inicio = time.time()
+            nova_rota, novo_custo, _ = reotimizar_rota(
+                rota, pontos, adicionados, removidos, metodo=metodo
+            )
+            tempo_incremental = time.time() - tempo_inicio
+
+            print(f"\n--- Resultado ({metodo}) ---")
+            print(f"Nova Rota: R -> {' -> '.join(nova_rota)} -> R")
+            print(f"Distância Total: {novo_custo}")
+            print(
+                f"Tempo incremental: {tempo_incremental:.4f} s "
+                f"({tempo_incremental / tempo_frio:.1%} da solução a frio de {tempo_frio:.4f} s)"
+            )
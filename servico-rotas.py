@@ -0,0 +1,314 @@
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from _carregador import LIMITE_FORCA_BRUTA, carregar_script
+
+# --- MÓDULO 1: Leitura das Instâncias Recebidas ---
+
+
+def ler_matriz_texto(texto):
+    """
+    Lê um cenário (grade dos arquivos `cenario*.txt` ou formato esparso) a
+    partir do texto e retorna o dicionário de pontos, como `ler_matriz`.
+    """
+    return carregar_script("algoritmo-genetico.py").ler_pontos_linhas(
+        texto.strip().splitlines()
+    )
+
+
+def ler_arestas_texto(texto, dimensao):
+    """
+    Lê os pesos do triângulo superior (formato de `edgesbrasil58.txt`) e
+    retorna o dicionário de distâncias usado pelo AG, com cidades de 1 a N.
+    """
+    if dimensao < 2:
+        raise ValueError(f"São necessárias pelo menos 2 cidades, recebidas {dimensao}.")
+    todos_os_pesos = [int(p) for p in texto.split()]
+    if len(todos_os_pesos) != dimensao * (dimensao - 1) // 2:
+        raise ValueError(
+            f"Esperados {dimensao * (dimensao - 1) // 2} pesos para {dimensao} cidades, "
+            f"recebidos {len(todos_os_pesos)}."
+        )
+    distancias = {}
+    k = 0
+    for i in range(1, dimensao + 1):
+        for j in range(i + 1, dimensao + 1):
+            distancias[(i, j)] = todos_os_pesos[k]
+            distancias[(j, i)] = todos_os_pesos[k]
+            k += 1
+    return distancias
+
+
+def normalizar_pedido(pedido):
+    """
+    Converte o JSON recebido em uma instância canônica e calcula seu hash.
+
+    Formatos aceitos:
+      {"formato": "grade", "conteudo": "<texto de um cenario*.txt ou esparso>"}
+      {"formato": "arestas", "conteudo": "<pesos do triângulo superior>", "dimensao": N}
+      {"formato": "matriz", "conteudo": [[...], ...]}  (matriz N x N completa)
+    Parâmetros opcionais do AG: "tam_pop" e "max_geracoes".
+    Lança ValueError para pedidos malformados.
+    """
+    if not isinstance(pedido, dict):
+        raise ValueError("O pedido deve ser um objeto JSON.")
+    formato = pedido.get("formato", "grade")
+    conteudo = pedido.get("conteudo")
+    if conteudo is None:
+        raise ValueError("O pedido não tem o campo 'conteudo'.")
+
+    if formato == "grade":
+        if not isinstance(conteudo, str):
+            raise ValueError("No formato 'grade', 'conteudo' deve ser o texto do cenário.")
+        pontos = ler_matriz_texto(conteudo)
+        if "R" not in pontos:
+            raise ValueError("O cenário não tem o ponto de origem 'R'.")
+        instancia = {"tipo": "grade", "pontos": pontos}
+        canonico = sorted((p, c["linha"], c["coluna"]) for p, c in pontos.items())
+    elif formato in ("arestas", "matriz"):
+        if formato == "arestas":
+            if not isinstance(conteudo, str):
+                raise ValueError("No formato 'arestas', 'conteudo' deve ser o texto dos pesos.")
+            dimensao = int(pedido["dimensao"])
+            distancias = ler_arestas_texto(conteudo, dimensao)
+        else:
+            if not isinstance(conteudo, list) or not all(
+                isinstance(linha, list) and len(linha) == len(conteudo) for linha in conteudo
+            ):
+                raise ValueError("A matriz de distâncias deve ser quadrada (N listas de N valores).")
+            dimensao = len(conteudo)
+            if dimensao < 2:
+                raise ValueError(f"A matriz precisa de pelo menos 2 cidades, recebidas {dimensao}.")
+            distancias = {
+                (i + 1, j + 1): int(conteudo[i][j])
+                for i in range(dimensao)
+                for j in range(dimensao)
+                if i != j
+            }
+        instancia = {
+            "tipo": "arestas",
+            "distancias": distancias,
+            "num_cidades": dimensao,
+        }
+        # Todas as arestas fora da diagonal: matrizes assimétricas que só
+        # coincidem no triângulo superior precisam de hashes diferentes
+        canonico = [dimensao] + [
+            distancias[(i, j)]
+            for i in range(1, dimensao + 1)
+            for j in range(1, dimensao + 1)
+            if i != j
+        ]
+    else:
+        raise ValueError(f"Formato desconhecido: '{formato}'.")
+
+    for parametro in ("tam_pop", "max_geracoes"):
+        if parametro in pedido:
+            instancia[parametro] = int(pedido[parametro])
+
+    chave = json.dumps(
+        [instancia["tipo"], canonico, instancia.get("tam_pop"), instancia.get("max_geracoes")]
+    )
+    return instancia, hashlib.sha256(chave.encode()).hexdigest()
+
+
+# --- MÓDULO 2: Processos de Resolução ---
+
+
+def aquecer_processo():
+    """Carrega os resolvedores (e o NumPy) uma única vez em cada processo."""
+    carregar_script("forca-bruta.py")
+    carregar_script("algoritmo-genetico.py")
+    carregar_script("algoritmo-genetico-grafico.py")
+    return os.getpid()
+
+
+def resolver_instancia(instancia):
+    """Resolve uma instância normalizada com o resolvedor mais adequado."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if instancia["tipo"] == "grade":
+            pontos = instancia["pontos"]
+            num_entregas = len(pontos) - 1
+            if num_entregas <= LIMITE_FORCA_BRUTA and "tam_pop" not in instancia:
+                rota, custo = carregar_script("forca-bruta.py").achar_menor_rota(pontos)
+                return {"rota": rota, "custo": custo, "resolvedor": "forca-bruta"}
+            # Mesmos parâmetros usados em algoritmo-genetico.py
+            tam_pop, max_geracoes = (50, 100) if num_entregas <= 5 else (100, 500)
+            rota, custo = carregar_script("algoritmo-genetico.py").algoritmo_genetico(
+                pontos,
+                tam_pop=instancia.get("tam_pop", tam_pop),
+                max_geracoes=instancia.get("max_geracoes", max_geracoes),
+            )
+            return {"rota": rota, "custo": custo, "resolvedor": "genetico"}
+
+        rota, custo, _ = carregar_script(
+            "algoritmo-genetico-grafico.py"
+        ).algoritmo_genetico_tsp(
+            instancia["distancias"],
+            instancia["num_cidades"],
+            tam_pop=instancia.get("tam_pop", 100),
+            max_geracoes=instancia.get("max_geracoes", 500),
+        )
+        return {"rota": rota, "custo": custo, "resolvedor": "genetico-tsp"}
+
+
+# --- MÓDULO 3: Serviço Assíncrono com Cache ---
+
+
+class ServicoRotas:
+    """
+    Recebe pedidos, consulta o cache LRU pelo hash da instância e despacha
+    as instâncias novas para um pool de processos já aquecido. Pedidos
+    idênticos que chegam ao mesmo tempo compartilham a mesma resolução.
+    """
+
+    def __init__(self, num_processos=None, tam_cache=1024):
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_processos, initializer=aquecer_processo
+        )
+        self.tam_cache = tam_cache
+        self.cache = OrderedDict()
+        self.em_andamento = {}
+        self.estatisticas = {
+            "pedidos": 0,
+            "acertos_cache": 0,
+            "compartilhados": 0,
+            "resolvidos": 0,
+            "erros": 0,
+        }
+
+    async def aquecer(self):
+        """Força a criação de todos os processos antes do primeiro pedido."""
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(
+            *[
+                loop.run_in_executor(self.executor, aquecer_processo)
+                for _ in range(self.num_processos)
+            ]
+        )
+        print(f"Pool aquecido com {len(set(pids))} processo(s).")
+
+    async def resolver(self, instancia, chave):
+        if chave in self.cache:
+            self.cache.move_to_end(chave)
+            self.estatisticas["acertos_cache"] += 1
+            return {**self.cache[chave], "cache": True}
+
+        if chave in self.em_andamento:
+            self.estatisticas["compartilhados"] += 1
+        else:
+            loop = asyncio.get_running_loop()
+            self.em_andamento[chave] = loop.run_in_executor(
+                self.executor, resolver_instancia, instancia
+            )
+        futuro = self.em_andamento[chave]
+        try:
+            resultado = await asyncio.shield(futuro)
+        finally:
+            self.em_andamento.pop(chave, None)
+
+        if chave not in self.cache:
+            self.estatisticas["resolvidos"] += 1
+            self.cache[chave] = resultado
+            if len(self.cache) > self.tam_cache:
+                self.cache.popitem(last=False)  # Remove o menos usado recentemente
+        return {**resultado, "cache": False}
+
+    async def tratar_conexao(self, leitor, escritor):
+        """Atende pedidos HTTP/1.1 (com keep-alive) em uma conexão."""
+        try:
+            while True:
+                linha_pedido = await leitor.readline()
+                if not linha_pedido:
+                    break
+                metodo, caminho, _ = linha_pedido.decode().split(" ", 2)
+
+                cabecalhos = {}
+                while True:
+                    linha = await leitor.readline()
+                    if linha in (b"\r\n", b"\n", b""):
+                        break
+                    nome, _, valor = linha.decode().partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+                corpo = await leitor.readexactly(int(cabecalhos.get("content-length", 0)))
+
+                status, resposta = await self.rotear(metodo, caminho, corpo)
+                dados = json.dumps(resposta).encode()
+                escritor.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(dados)}\r\n\r\n".encode()
+                    + dados
+                )
+                await escritor.drain()
+                if cabecalhos.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+    async def rotear(self, metodo, caminho, corpo):
+        if metodo == "GET" and caminho == "/estatisticas":
+            return "200 OK", {**self.estatisticas, "tamanho_cache": len(self.cache)}
+        if metodo == "POST" and caminho == "/resolver":
+            self.estatisticas["pedidos"] += 1
+            tempo_inicio = time.perf_counter()
+            try:
+                instancia, chave = normalizar_pedido(json.loads(corpo))
+            except Exception as erro:
+                # Qualquer falha ao interpretar o pedido é culpa da entrada
+                self.estatisticas["erros"] += 1
+                return "400 Bad Request", {"erro": str(erro)}
+            try:
+                resultado = await self.resolver(instancia, chave)
+            except Exception as erro:
+                # Falha do resolvedor ou do processo: responde em vez de derrubar a conexão
+                self.estatisticas["erros"] += 1
+                return "500 Internal Server Error", {"erro": f"{type(erro).__name__}: {erro}"}
+            resultado["tempo"] = time.perf_counter() - tempo_inicio
+            return "200 OK", resultado
+        return "404 Not Found", {"erro": f"Rota desconhecida: {metodo} {caminho}"}
+
+
+async def executar_servico(host, porta, caminho_unix, num_processos, tam_cache):
+    servico = ServicoRotas(num_processos, tam_cache)
+    await servico.aquecer()
+    if caminho_unix:
+        servidor = await asyncio.start_unix_server(servico.tratar_conexao, caminho_unix)
+        print(f"Serviço de rotas ouvindo em unix:{caminho_unix}")
+    else:
+        servidor = await asyncio.start_server(servico.tratar_conexao, host, porta)
+        print(f"Serviço de rotas ouvindo em http://{host}:{porta}")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servico.executor.shutdown()
+
+
+# --- Bloco Principal para Execução ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço local de resolução de rotas do FlyFood")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--unix", help="Caminho de um socket Unix (substitui host/porta)")
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--cache", type=int, default=1024, help="Número máximo de resultados no cache")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(
+            executar_servico(args.host, args.porta, args.unix, args.processos, args.cache)
+        )
+    except KeyboardInterrupt:
+        print("\nServiço encerrado.")
@@ -0,0 +1,57 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _carregador import carregar_script
+
+lote = carregar_script("lote-cenarios.py")
+
+CENARIO = "3 3\nR 0 A\n0 B 0\n0 0 C"
+
+
+def escrever_jsonl(caminho, linhas):
+    caminho.write_text("\n".join(linhas) + "\n")
+    return str(caminho)
+
+
+def test_linha_invalida_nao_interrompe_o_lote(tmp_path):
+    arquivo = escrever_jsonl(
+        tmp_path / "pedidos.jsonl",
+        [
+            json.dumps({"id": "a", "conteudo": CENARIO}),
+            json.dumps({"id": "b", "conteudo": 5}),
+            "isto não é JSON",
+            json.dumps({"id": "d", "formato": "matriz", "conteudo": [[0, "x"], ["x", 0]]}),
+            json.dumps({"id": "e", "conteudo": CENARIO}),
+        ],
+    )
+
+    resultados = list(lote.resolver_lote(lote.ler_pedidos_jsonl(arquivo), num_processos=1))
+
+    assert [r["id"] for r in resultados] == ["a", "b", 3, "d", "e"]
+    assert [("erro" in r) for r in resultados] == [False, True, True, True, False]
+    assert resultados[0]["custo"] == resultados[4]["custo"]
+    assert resultados[4]["duplicado"]
+
+
+def test_excecao_inesperada_vira_registro_de_erro(monkeypatch):
+    normalizar = lote.normalizar_pedido
+
+    def normalizar_com_falha(pedido):
+        if pedido.get("id") == "b":
+            raise AttributeError("falha inesperada")
+        return normalizar(pedido)
+
+    monkeypatch.setattr(lote, "normalizar_pedido", normalizar_com_falha)
+    pedidos = [
+        ("a", {"id": "a", "conteudo": CENARIO}),
+        ("b", {"id": "b", "conteudo": CENARIO}),
+        ("c", {"id": "c", "conteudo": CENARIO}),
+    ]
+
+    resultados = list(lote.resolver_lote(iter(pedidos), num_processos=1))
+
+    assert [r["id"] for r in resultados] == ["a", "b", "c"]
+    assert resultados[1] == {"id": "b", "erro": "falha inesperada"}